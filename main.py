@@ -7,9 +7,33 @@ class ProjectManager
 """
 
 from __future__ import annotations
+import functools
 import itertools
 from datetime import datetime
-from typing import List, Dict
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_mdy(date: str) -> datetime:
+    """Parses date in format of '09/30/2022' without strptime overhead.
+    Results are memoized, since the same dates recur across assignments
+    and as repeated cut-offs.
+    Arguments:
+        date (str): date string as month/day/year.
+    Returns:
+        datetime instance.
+    Raises:
+        ValueError, if date doesn't match '%m/%d/%Y' like strptime would.
+    """
+    month, day, year = date.split("/")
+    if len(day) == 2 and day[0] == " " and day[1] in "123456789":
+        # %d also accepts a space-padded day, e.g. '01/ 5/2022'.
+        day = day[1]
+    if not (len(year) == 4 and len(month) <= 2 and len(day) <= 2
+            and (month + day + year).isascii()
+            and month.isdigit() and day.isdigit() and year.isdigit()):
+        raise ValueError(f"time data {date!r} does not match format "
+                         f"'%m/%d/%Y'")
+    return datetime(int(year), int(month), int(day))
 
 
 class Developer:
@@ -22,128 +46,205 @@ class Developer:
         phone_number (str) : Person's working phone number.
         position (str): Persons company position (e.g., 'Junior').
         salary (str): Salary amount (can be re-calculated).
-        projects (List[Projects]): List of assigned projects
+        projects (list[Projects]): List of assigned projects
                             (many-to-many with Project instance).
-        assignments (List[Assignment]): List of assigned tasks in
+        assignments (list[Assignment]): List of assigned tasks in
                                     Assignment container.
+        _project_ids (set[int]): IDs of assigned projects, mirrors
+                            `projects` for O(1) membership checks.
+        _projects_by_title (dict[str, Project]): assigned projects
+                            indexed by title at assignment time for
+                            O(1) title lookups.
     """
 
-    id_iter = itertools.count()
+    __slots__ = ("_id", "full_name", "address", "email", "phone_number",
+                 "position", "salary", "projects", "assignments",
+                 "_project_ids", "_projects_by_title")
+
+    _id_iter = itertools.count()
 
     def __init__(self, full_name: str, address: str, email: str,
                  phone_number: str, position: str, salary: str) -> None:
         """Developer's initializer.
         """
-        self._id = next(self.id_iter)
-        self.full_name: str = full_name
-        self.address: str = address
-        self.email: str = email
-        self.phone_number: str = phone_number
-        self.position: str = position
-        self.salary: str = salary
-        self.projects: List[Project] = []
-        self.assignments: List[Assignment] = []
-
-    def get_assigned_projects(self) -> List[str]:
+        self._id = next(Developer._id_iter)
+        self.full_name = full_name
+        self.address = address
+        self.email = email
+        self.phone_number = phone_number
+        self.position = position
+        self.salary = salary
+        self.projects = []
+        self.assignments = []
+        self._project_ids = set()
+        self._projects_by_title = {}
+
+    def get_assigned_projects(self) -> list[str]:
         """Returns all project titles assigned to developer.
          Arguments:
             None.
         Returns:
-            List[str], list of project titles
+            list[str], list of project titles
         """
         return [project.title for project in self.projects]
 
-    def assign(self, project: Project) -> None:
+    def has_project_titled(self, title: str) -> bool:
+        """Checks whether project with given title is assigned.
+        Arguments:
+            title (str): Project's name.
+        Returns:
+            bool, True if developer is assigned to such project.
+        """
+        project = self._projects_by_title.get(title)
+        # Project.title is mutable, so the indexed key may be outdated.
+        return (project is not None and project._id in self._project_ids
+                and project.title == title)
+
+    def assign(self, project: Project) -> bool:
         """Assigns current developer to project instance.
         Args:
             project (Project): Project instance to be assigned to developer.
         Returns:
-            None.
+            bool, False if project was already assigned.
         """
-        if project in self.projects:
-            raise ValueError(f"Project {project.title} already exists")
+        if project._id in self._project_ids:
+            return False
+        self._project_ids.add(project._id)
         self.projects.append(project)
+        self._projects_by_title.setdefault(project.title, project)
         print(f"Project {project.title} has been added to developer "
               f"{self.full_name}")
+        return True
 
-    def cancel_appointment(self, project: Project) -> None:
-        """Assigns current developer to project instance.
+    def cancel_appointment(self, project: Project) -> bool:
+        """Removes current developer from project instance.
         Arguments:
             project (Project): Project instance to be removed from developer.
         Returns:
-            None.
+            bool, False if project was not assigned.
         """
-        if project in self.projects:
-            self.projects.remove(project)
-            print(f"Project {project.title} has been removed from developer {self.full_name}")
+        if project._id not in self._project_ids:
+            return False
+        self._project_ids.discard(project._id)
+        self.projects.remove(project)
+        # Look up by identity, the title may have changed since assign.
+        title = next((key for key, indexed in self._projects_by_title.items()
+                      if indexed is project), None)
+        if title is not None:
+            del self._projects_by_title[title]
+            # Titles aren't unique, re-index the next project if any.
+            for other in self.projects:
+                if other.title == title:
+                    self._projects_by_title[title] = other
+                    break
+        print(f"Project {project.title} has been removed from developer {self.full_name}")
+        return True
 
     def __str__(self):
         """String representation of the Developer"""
-        return f"Developer {self.full_name}"
+        return "Developer " + self.full_name
 
 
 class Assignment:
     """Assignment as the container for tasks.
     Related to Developer, QAEngineer and ProjectManager classes.
     Attributes:
-        received_tasks (Dict): dictionary in form of
+        received_tasks (dict): dictionary in form of
                         {date1: task1, date2: task2,...}.
                         Here date1, date2, ... are strings from datetime.
                         E.g., d = datetime.now(); d = d.utctime("%m/%d/%Y")
         is_done (bool): True, if all tasks are completed.
         description (str): General assignment description.
         status (str): Percent of completed tasks.
+        _date_ordinals (dict[str, int]): cache of `received_tasks` keys
+                        parsed into proleptic Gregorian ordinals.
     """
 
+    __slots__ = ("description", "received_tasks", "status", "is_done",
+                 "_date_ordinals")
+
     def __init__(self, description: str) -> None:
         """Assignment initializer."""
-        self.description: str = description
-        self.received_tasks: Dict = {}
-        self.status: str = ""
+        self.description = description
+        self.received_tasks = {}
+        self.status = ""
         self.is_done = False
+        self._date_ordinals = {}
 
-    def get_tasks_to_date(self, date: str) -> List:
+    def add_task(self, date: str, task: dict) -> None:
+        """Adds task to received tasks and caches its parsed date.
+        Arguments:
+            date (str): should be in format of '09/30/2022'!.
+            task (dict): task to be stored, e.g. {"is_done": False}.
+        Returns:
+            None.
+        """
+        self._date_ordinals[date] = _parse_mdy(date).toordinal()
+        self.received_tasks[date] = task
+
+    def get_tasks_to_date(self, date: str) -> list:
         """Returns all tasks before date in arguments.
         Arguments:
             date (str): should be in format of '09/30/2022'!.
         Returns:
             List of tasks.
         """
-        date_to_compare = datetime.strptime(date, "%m/%d/%Y")
-        # List comprehension
-        return [v for k, v in self.received_tasks.items()
-                if datetime.strptime(k, "%m/%d/%Y") < date_to_compare]
+        date_to_compare = _parse_mdy(date).toordinal()
+        date_ordinals = self._date_ordinals
+        tasks = []
+        for k, v in self.received_tasks.items():
+            ordinal = date_ordinals.get(k)
+            if ordinal is None:
+                # Key set directly on received_tasks, parse and cache it.
+                ordinal = date_ordinals[k] = _parse_mdy(k).toordinal()
+            if ordinal < date_to_compare:
+                tasks.append(v)
+        # Every current key is cached now, so extra entries are stale.
+        if len(date_ordinals) > len(self.received_tasks):
+            self._date_ordinals = {k: date_ordinals[k]
+                                   for k in self.received_tasks}
+        return tasks
 
     def calculate_status(self) -> None:
         """Calculates percentage of implemented tasks.
         Arguments:
             None.
         """
-        tasks = [task for _, task in self.received_tasks.items()
-                 if task["is_done"]]
-        if tasks:
-            self.status = str(100 * len(tasks) / len(self.received_tasks)) + "%"
+        done = sum(1 for task in self.received_tasks.values()
+                   if task["is_done"])
+        if done:
+            self.status = f"{100 * done / len(self.received_tasks)}%"
         else:
-            self.status = str("0%")
+            self.status = "0%"
 
 
 class Project:
     """Project representation.
     Attributes:
+        _id (int): Project ID, is incremented for each instance.
         title (str): Project's name.
         start_date (str): Start date.
-        tasks_list (List): list of all tasks related to project.
-        developers (List[Developer]): List of assigned developers.
+        tasks_list (list): list of all tasks related to project.
+        developers (list[Developer]): List of assigned developers.
         limit (int): specifies maximum number of workers.
+        _developer_ids (set[int]): IDs of assigned developers, mirrors
+                            `developers` for O(1) membership checks.
     """
 
+    __slots__ = ("_id", "title", "start_date", "tasks_list", "developers",
+                 "_developer_ids", "limit")
+
+    _id_iter = itertools.count()
+
     def __init__(self, title: str, limit: int) -> None:
         """Project initializer."""
-        self.title: str = title
-        self.start_date: str = datetime.now().strftime("%m/%d/%Y")
-        self.tasks_list: List[Dict] = []
-        self.developers: List[Developer] = []
-        self.limit: int = limit
+        self._id = next(Project._id_iter)
+        self.title = title
+        self.start_date = datetime.now().strftime("%m/%d/%Y")
+        self.tasks_list = []
+        self.developers = []
+        self._developer_ids = set()
+        self.limit = limit
 
     def add_developer(self, developer: Developer) -> None:
         """Assigns developer to project instance.
@@ -152,10 +253,12 @@ class Project:
         Returns:
             None.
         """
-        try:
-            developer.assign(project=self)
-        except ValueError:
+        if developer._id in self._developer_ids:
             print(f"Developer {developer.full_name} exists")
+            return
+        # Developer may already hold the project via Developer.assign.
+        developer.assign(self)
+        self._developer_ids.add(developer._id)
         self.developers.append(developer)
 
     def remove_developer(self, developer: Developer) -> None:
@@ -165,7 +268,13 @@ class Project:
         Returns:
             None.
         """
-        developer.cancel_appointment(project=self)
+        if developer._id not in self._developer_ids:
+            raise ValueError(f"Developer {developer.full_name} is not assigned")
+        if not developer.cancel_appointment(self):
+            # Project was cancelled on the developer's side directly.
+            print(f"Project {self.title} was already removed from developer "
+                  f"{developer.full_name}")
+        self._developer_ids.discard(developer._id)
         self.developers.remove(developer)
 
 
@@ -179,24 +288,27 @@ class QAEngineer:
         phone_number (str) : Person's working phone number.
         position (str): Persons company position (e.g., 'Junior').
         salary (str): Salary amount (can be re-calculated).
-        projects (List[Projects]): List of assigned projects
+        projects (list[Projects]): List of assigned projects
                         (many-to-many with Project instance).
     """
 
-    id_iter = itertools.count()
+    __slots__ = ("_id", "full_name", "address", "email", "phone_number",
+                 "position", "salary", "projects")
+
+    _id_iter = itertools.count()
 
     def __init__(self, full_name: str, address: str, email: str,
                  phone_number: str, position: str, salary: str) -> None:
         """QAEngineer's initializer.
         """
-        self._id = next(self.id_iter)
-        self.full_name: str = full_name
-        self.address: str = address
-        self.email: str = email
-        self.phone_number: str = phone_number
-        self.position: str = position
-        self.salary: str = salary
-        self.projects: List[Project] = []
+        self._id = next(QAEngineer._id_iter)
+        self.full_name = full_name
+        self.address = address
+        self.email = email
+        self.phone_number = phone_number
+        self.position = position
+        self.salary = salary
+        self.projects = []
 
     def test_feature(self, assignment: Assignment) -> str:
         """Simply the stub method, will be implemented in future.
@@ -205,8 +317,8 @@ class QAEngineer:
         Returns:
             String contains dummy info about testing:).
         """
-        return f"Assignment {assignment.description} has been tested " \
-               f"by {self.full_name}"
+        return (f"Assignment {assignment.description} has been tested "
+                f"by {self.full_name}")
 
 
 class ProjectManager:
@@ -222,21 +334,24 @@ class ProjectManager:
         project (Projects): Assume PM -> Project relation.
     """
 
-    id_iter = itertools.count()
+    __slots__ = ("_id", "full_name", "address", "email", "phone_number",
+                 "position", "salary", "project")
+
+    _id_iter = itertools.count()
 
     def __init__(self, full_name: str, address: str, email: str,
                  phone_number: str, position: str, salary: str,
                  project: Project) -> None:
         """ProjectManager initializer.
         """
-        self._id = next(self.id_iter)
-        self.full_name: str = full_name
-        self.address: str = address
-        self.email: str = email
-        self.phone_number: str = phone_number
-        self.position: str = position
-        self.salary: str = salary
-        self.project: project = project
+        self._id = next(ProjectManager._id_iter)
+        self.full_name = full_name
+        self.address = address
+        self.email = email
+        self.phone_number = phone_number
+        self.position = position
+        self.salary = salary
+        self.project = project
 
     def discuss_progress(self, developer: Developer) -> str:
         """Simply the stub method, will be implemented in future.
@@ -246,9 +361,9 @@ class ProjectManager:
             String contains dummy discussion:).
         """
 
-        # Let's obtain each assignment description.
-        descriptions = [assignment.description for assignment in developer.assignments]
-        # concat list of strings (descriptions) into one string
-        descriptions = " ".join(descriptions)
-        return f"Task's progress of {descriptions} has been tested " \
-               f"by {self.full_name}"
+        # Concat each assignment description into one string; join gets
+        # a list since it needs the total size up front anyway.
+        descriptions = " ".join([assignment.description
+                                 for assignment in developer.assignments])
+        return (f"Task's progress of {descriptions} has been tested "
+                f"by {self.full_name}")